@@ -0,0 +1,40 @@
+"""Build the card sprite atlas used by window.py.
+
+Packs every card face, pre-scaled to the window's card size, into a
+single PNG so the game decodes one image instead of 53 at startup.
+
+Layout (cell = 72x96):
+- Rows 0-3: one suit per row, ranks 2..A across (same order as
+  cards.ALL_CARDS, so cell index == Card.image_id)
+- Row 4, column 0: card back (window.CARD_BACK_FILE)
+
+Run from the project root after changing card art or card size:
+    python build_atlas.py
+"""
+
+import os
+import pygame
+import cards
+from window import CARD_ATLAS_FILE, CARD_ATLAS_COLUMNS, CARD_BACK_FILE, CARD_SIZE
+
+
+def build_atlas(assets_path: str, out_path: str):
+    """Scale each card PNG in assets_path and pack them into out_path."""
+    card_w, card_h = CARD_SIZE
+    rows = len(cards.ALL_CARDS) // CARD_ATLAS_COLUMNS + 1  # + back row
+    atlas = pygame.Surface((CARD_ATLAS_COLUMNS * card_w, rows * card_h), pygame.SRCALPHA)
+
+    files = [card.image_key() + '.png' for card in cards.ALL_CARDS] + [CARD_BACK_FILE]
+    for idx, fname in enumerate(files):
+        img = pygame.transform.scale(pygame.image.load(os.path.join(assets_path, fname)), CARD_SIZE)
+        col, row = idx % CARD_ATLAS_COLUMNS, idx // CARD_ATLAS_COLUMNS
+        # Copy pixels (alpha included) rather than blending onto the atlas
+        atlas.blit(img, (col * card_w, row * card_h), special_flags=pygame.BLEND_RGBA_MAX)
+
+    pygame.image.save(atlas, out_path)
+
+
+if __name__ == "__main__":
+    here = os.path.dirname(os.path.abspath(__file__))
+    build_atlas(os.path.join(here, 'pygame_cards-0.1', 'cards', 'PNG'), CARD_ATLAS_FILE)
+    print(f"Wrote {CARD_ATLAS_FILE}")
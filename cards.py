@@ -1,98 +1,129 @@
 """Card representations and deck management for Blackjack."""
 
+import array
 import random
-from typing import List
-from enum import Enum
-
-
-class Suit(Enum):
-    """Card suits (Unicode symbols)."""
-    HEARTS = ("♥", "H")
-    DIAMONDS = ("♦", "D")
-    CLUBS = ("♣", "C")
-    SPADES = ("♠", "S")
-
-
-class Rank(Enum):
-    """Card ranks with display name and blackjack value.
-    
-    Format: (display_string, base_value)
-    - Numbers 2-10: face value
-    - Face cards (J, Q, K): 10
-    - Ace: 11 (can convert to 1 in hand_logic)
-    """
-    TWO = ("2", 2)
-    THREE = ("3", 3)
-    FOUR = ("4", 4)
-    FIVE = ("5", 5)
-    SIX = ("6", 6)
-    SEVEN = ("7", 7)
-    EIGHT = ("8", 8)
-    NINE = ("9", 9)
-    TEN = ("10", 10)
-    JACK = ("J", 10)
-    QUEEN = ("Q", 10)
-    KING = ("K", 10)
-    ACE = ("A", 11)
-
-    def __init__(self, display, base_value):
-        self.display = display
-        self.base_value = base_value
+from collections import namedtuple
+
+
+# Card suits (Unicode symbol, short letter used in image file names)
+Suit = namedtuple('Suit', 'symbol short')
+
+SUITS = (
+    Suit("♥", "H"),  # hearts
+    Suit("♦", "D"),  # diamonds
+    Suit("♣", "C"),  # clubs
+    Suit("♠", "S"),  # spades
+)
+
+# Card ranks with display name and blackjack value.
+# - Numbers 2-10: face value
+# - Face cards (J, Q, K): 10
+# - Ace: 11 (can convert to 1 in hand_logic)
+# Plain namedtuples rather than Enums: the code only reads attributes,
+# so Enum's descriptor and __eq__ machinery is pure overhead.
+Rank = namedtuple('Rank', 'display base_value is_ace')
+
+RANKS = (
+    Rank("2", 2, False),
+    Rank("3", 3, False),
+    Rank("4", 4, False),
+    Rank("5", 5, False),
+    Rank("6", 6, False),
+    Rank("7", 7, False),
+    Rank("8", 8, False),
+    Rank("9", 9, False),
+    Rank("10", 10, False),
+    Rank("J", 10, False),
+    Rank("Q", 10, False),
+    Rank("K", 10, False),
+    Rank("A", 11, True),
+)
 
 
 class Card:
     """Single playing card with suit and rank."""
 
+    # No per-instance __dict__: smaller cards and faster attribute reads
+    __slots__ = ('suit', 'rank', 'value', 'is_ace', 'image_id', '_str', '_image_key')
+
     def __init__(self, suit: Suit, rank: Rank):
         self.suit = suit
         self.rank = rank
+        # Cached for calculate_hand_value (avoids rank lookups per card)
+        self.value = rank.base_value
+        self.is_ace = rank.is_ace
+        # Small int id (0-51, position in ALL_CARDS) for image lookups
+        self.image_id = SUITS.index(suit) * len(RANKS) + RANKS.index(rank)
+        # Display strings never change, so build them once per card.
+        self._str = f"{rank.display}{suit.symbol}"
+        # File names use rank + suit short (e.g., 'AH', '10D', 'QS')
+        self._image_key = f"{rank.display}{suit.short}"
 
     def __str__(self) -> str:
         """Returns card string (e.g., 'A♥', '10♦')."""
-        return f"{self.rank.display}{self.suit.value}"
+        return self._str
 
     def get_value(self, allow_ace_as_one: bool = False) -> int:
         """Return card value. Aces default to 11, or 1 if allow_ace_as_one=True."""
-        if self.rank == Rank.ACE and allow_ace_as_one:
+        if self.is_ace and allow_ace_as_one:
             return 1
-        return self.rank.base_value
+        return self.value
     def image_key(self) -> str:
         '''returns the image key so that it can pull the assigned png 
         examples AH, AS ect.'''
-        # File names use rank + suit short (e.g., 'AH', '10D', 'QS')
-        rank = self.rank.display
-        # Suit value is stored as a tuple (symbol, short) => ('♥','H')
-        suit_short = self.suit.value[1]
-        return f"{rank}{suit_short}"
+        return self._image_key
 
 
 
+# One shared Card per (suit, rank); decks hold indices into this tuple
+ALL_CARDS = tuple(Card(suit, rank) for suit in SUITS for rank in RANKS)
+
+
 class Deck:
-    """Standard 52-card deck with shuffle and deal operations."""
+    """Standard 52-card deck with shuffle and deal operations.
 
-    def __init__(self):
-        self.cards: List[Card] = []
-        self._build()
+    Stores card indices (0-51) into ALL_CARDS in a compact byte array,
+    so building or shuffling a deck never allocates Card objects.
+    Dealing advances a cursor instead of removing from the buffer.
+    """
 
-    def _build(self):
-        """Build complete 52-card deck (4 suits × 13 ranks)."""
-        for suit in Suit:
-            for rank in Rank:
-                self.cards.append(Card(suit, rank))
+    def __init__(self):
+        self._buf = array.array('b', range(len(ALL_CARDS)))
+        self._top = 0
 
     def shuffle(self):
-        """Randomize card order."""
-        random.shuffle(self.cards)
+        """Randomize the order of the cards not yet dealt.
+
+        In-place Fisher-Yates; the swap index uses multiply-and-shift on a
+        32-bit draw instead of a modulo (bias is below 52 / 2**32).
+        """
+        buf = self._buf
+        top = self._top
+        randbits = random.getrandbits
+        for i in range(len(buf) - 1, top, -1):
+            j = top + ((randbits(32) * (i - top + 1)) >> 32)
+            buf[i], buf[j] = buf[j], buf[i]
+
+    def reset_and_shuffle(self):
+        """Return all dealt cards to the deck and reshuffle in place.
+
+        The buffer always holds all 52 indices, so this only rewinds the
+        cursor; nothing is allocated.
+        """
+        self._top = 0
+        self.shuffle()
 
     def deal(self) -> Card:
         """Deal a card from the top of the deck.
         
         Raises ValueError if deck is empty (reshuffle handled in game.py).
         """
-        if not self.cards:
+        if self._top >= len(self._buf):
             raise ValueError("Deck is empty")
-        return self.cards.pop()
+        card = ALL_CARDS[self._buf[self._top]]
+        self._top += 1
+        return card
 
     def remaining(self) -> int:
         """Return number of cards left in deck."""
-        return len(self.cards)
+        return len(self._buf) - self._top
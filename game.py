@@ -1,8 +1,30 @@
 """Blackjack game state machine and logic."""
 
-from typing import Tuple, List
-from cards import Deck
-from hand_logic import calculate_hand_value, compare_hands
+from collections import deque
+from typing import Deque, Tuple
+from cards import Card, Deck
+from hand_logic import add_card_value, calculate_hand_value, compare_hands
+
+
+# Game states (ints so the per-frame state checks are cheap compares)
+BETTING, DEALING, PLAYING, RESULT, WON, LOST, OUT_OF_MONEY = range(7)
+
+# Display/logging names, indexed by state
+_STATE_NAMES = ("betting", "dealing", "playing", "result", "won", "lost", "out_of_money")
+
+
+# Natural blackjack outcomes keyed on (player has 21, dealer has 21):
+# (next game_state, result_message, balance change as a function of bet)
+_NATURAL_OUTCOMES = {
+    # Player has blackjack, dealer doesn't: 3:2 payout
+    (True, False): (RESULT, "Natural Blackjack! Player wins!", lambda bet: bet * 3 // 2),
+    # Dealer has blackjack, player doesn't
+    (False, True): (RESULT, "Dealer has Blackjack! Dealer wins.", lambda bet: -bet),
+    # Both have blackjack: push, balance unchanged
+    (True, True): (RESULT, "Both have Blackjack! Push.", lambda bet: 0),
+    # No natural blackjack - proceed to normal play
+    (False, False): (PLAYING, "", lambda bet: 0),
+}
 
 
 class BlackjackGame:
@@ -20,28 +42,41 @@ class BlackjackGame:
         self.deck = Deck()
         self.deck.shuffle()
 
-        # Player and dealer hands
-        self.player_hand: List = []
-        self.dealer_hand: List = []
+        # Player and dealer hands; reused across rounds (cleared, never rebuilt)
+        self.player_hand: Deque[Card] = deque()
+        self.dealer_hand: Deque[Card] = deque()
 
-        # Game state: one of betting, dealing, playing, result, won, lost, out_of_money
-        # DON'T modify these strings without updating all references in window.py
-        self.game_state = "betting"
+        # Game state: one of BETTING, DEALING, PLAYING, RESULT, WON, LOST, OUT_OF_MONEY
+        # DON'T modify these constants without updating all references in window.py
+        self.game_state = BETTING
         self.result_message = ""
 
+        # (total, soft) of player_hand, updated card by card as it grows
+        self._player_score = (0, False)
+
+        # Display strings, rebuilt only after a hand changes
+        self._player_str_cache = None
+        self._dealer_str_cache = [None, None]  # indexed by hide_hole_card
+
+    def _invalidate_hand_strs(self):
+        """Drop cached hand strings; call after any hand mutation."""
+        self._player_str_cache = None
+        self._dealer_str_cache = [None, None]
+
     def reset_for_new_hand(self):
         """Reset hands and state for a new round."""
         self.player_hand.clear()
         self.dealer_hand.clear()
-        self.game_state = "betting"
+        self._player_score = (0, False)
+        self._invalidate_hand_strs()
+        self.game_state = BETTING
         self.result_message = ""
         self.current_bet = 0
 
         # Reshuffle if deck is getting low (less than 10 cards)
         # This prevents card shortage during play
         if self.deck.remaining() < 10:
-            self.deck = Deck()
-            self.deck.shuffle()
+            self.deck.reset_and_shuffle()
 
     def place_bet(self, amount: int = 0) -> Tuple[bool, str]:
         """Place a bet for the current hand.
@@ -63,7 +98,7 @@ class BlackjackGame:
 
         # Bet is valid - set it and move to dealing state
         self.current_bet = amount
-        self.game_state = "dealing"
+        self.game_state = DEALING
         return True, f"Bet placed: {amount}. Dealing cards..."
 
     def deal_initial_hands(self):
@@ -75,57 +110,43 @@ class BlackjackGame:
         - Player 21 + Dealer not 21: Player wins (3:2 payout)
         - Dealer 21 + Player not 21: Dealer wins (player loses bet)
         - Both 21: Push (tie, no money exchanges)
-        - Neither 21: Continue to "playing" state for hits/stands
+        - Neither 21: Continue to PLAYING state for hits/stands
         
         Payout Calculation:
-        - Natural blackjack pays 3:2 (bet * 1.5)
+        - Natural blackjack pays 3:2 (bet * 3 // 2, integer arithmetic)
         - Example: $100 bet × 1.5 = $150 win, $250 total returned
         
         State Transitions:
-        - If natural blackjack detected: → "result" (game over)
-        - Otherwise: → "playing" (player can hit/stand)
+        - If natural blackjack detected: → RESULT (game over)
+        - Otherwise: → PLAYING (player can hit/stand)
         
         BREAK POINTS:
         - If 21 check uses != instead of ==, logic fails
         - If 3:2 payout calculation changes, house goes broke
         - If state transitions change, dealer won't get their turn
         """
-        # Deal 2 cards to each
-        self.player_hand = [self.deck.deal(), self.deck.deal()]
-        self.dealer_hand = [self.deck.deal(), self.deck.deal()]
+        # Deal 2 cards to each, reusing the hand containers
+        self.player_hand.clear()
+        self.dealer_hand.clear()
+        self.player_hand.extend((self.deck.deal(), self.deck.deal()))
+        self.dealer_hand.extend((self.deck.deal(), self.deck.deal()))
+        self._invalidate_hand_strs()
         
         # Calculate initial totals
-        player_total, _ = calculate_hand_value(self.player_hand)
+        self._player_score = calculate_hand_value(self.player_hand)
+        player_total, _ = self._player_score
         dealer_total, _ = calculate_hand_value(self.dealer_hand)
         
         # Check for natural blackjack (21 on first two cards)
-        if player_total == 21 and dealer_total != 21:
-            # Player has blackjack, dealer doesn't
-            self.game_state = "result"
-            self.result_message = "Natural Blackjack! Player wins!"
-            # 3:2 payout for natural blackjack
-            self.balance += int(self.current_bet * 1.5)
-            
-        elif dealer_total == 21 and player_total != 21:
-            # Dealer has blackjack, player doesn't
-            self.game_state = "result"
-            self.result_message = "Dealer has Blackjack! Dealer wins."
-            self.balance -= self.current_bet
-            
-        elif player_total == 21 and dealer_total == 21:
-            # Both have blackjack
-            self.game_state = "result"
-            self.result_message = "Both have Blackjack! Push."
-            # Balance unchanged on push
-            
-        else:
-            # No natural blackjack - proceed to normal play
-            self.game_state = "playing"
+        new_state, message, payout = _NATURAL_OUTCOMES[(player_total == 21, dealer_total == 21)]
+        self.game_state = new_state
+        self.result_message = message
+        self.balance += payout(self.current_bet)
 
     def player_hit(self) -> Tuple[str, str]:
         """Player takes another card.
         
-        Can only hit during "playing" state.
+        Can only hit during PLAYING state.
         Checks for bust after drawing.
         
         Returns:
@@ -134,8 +155,8 @@ class BlackjackGame:
             - message: Descriptive text for display
         
         State Transitions:
-        - Valid hit, not busted: stays in "playing"
-        - Valid hit, busted (> 21): → "result" (game over, player loses)
+        - Valid hit, not busted: stays in PLAYING
+        - Valid hit, busted (> 21): → RESULT (game over, player loses)
         - Invalid state: stays current (error shown to player)
         
         Bust Logic:
@@ -144,20 +165,23 @@ class BlackjackGame:
         
         BREAK POINTS:
         - If > 21 check changes to >=, hard totals fail
-        - If state != "playing" check is removed, player hits in wrong state
+        - If state != PLAYING check is removed, player hits in wrong state
         - If balance -= current_bet is removed, player doesn't lose money
         """
         # Only allow hitting during active play
-        if self.game_state != "playing":
+        if self.game_state != PLAYING:
             return "invalid", "Cannot hit now."
 
-        # Draw a card
-        self.player_hand.append(self.deck.deal())
-        player_total, _ = calculate_hand_value(self.player_hand)
+        # Draw a card and score it against the running total
+        card = self.deck.deal()
+        self.player_hand.append(card)
+        self._invalidate_hand_strs()
+        self._player_score = add_card_value(*self._player_score, card)
+        player_total, _ = self._player_score
 
         # Check if player busted
         if player_total > 21:
-            self.game_state = "result"
+            self.game_state = RESULT
             self.result_message = f"Player busts with {player_total}. Dealer wins."
             self.balance -= self.current_bet
             return "bust", self.result_message
@@ -186,11 +210,11 @@ class BlackjackGame:
         
         State Transitions:
         - Valid stand: Dealer plays, compare hands
-        - Player wins: → "result", balance += bet
-        - Player loses: → "result", balance -= bet (already done in hit())
-        - Push (tie): → "result", balance unchanged
-        - If balance >= target_balance: → "won" (game won!)
-        - If balance <= 0: → "out_of_money" (game over, prompt for reset)
+        - Player wins: → RESULT, balance += bet
+        - Player loses: → RESULT, balance -= bet (already done in hit())
+        - Push (tie): → RESULT, balance unchanged
+        - If balance >= target_balance: → WON (game won!)
+        - If balance <= 0: → OUT_OF_MONEY (game over, prompt for reset)
         
         BREAK POINTS:
         - If dealer >= 17 changes to > 17, soft 17s won't stand
@@ -199,19 +223,20 @@ class BlackjackGame:
         - If compare_hands() result string changes, balance updates fail
         """
         # Can only stand during active play
-        if self.game_state != "playing":
+        if self.game_state != PLAYING:
             return "invalid", "Cannot stand now."
 
         # Dealer plays: hits on 16 or less, stands on 17+
-        while True:
-            dealer_total, _ = calculate_hand_value(self.dealer_hand)
-            if dealer_total >= 17:
-                break
-            self.dealer_hand.append(self.deck.deal())
-
-        # Compare final hands
-        player_total, _ = calculate_hand_value(self.player_hand)
-        dealer_total, _ = calculate_hand_value(self.dealer_hand)
+        # Total is updated per drawn card rather than rescoring the hand
+        dealer_total, dealer_soft = calculate_hand_value(self.dealer_hand)
+        while dealer_total < 17:
+            card = self.deck.deal()
+            self.dealer_hand.append(card)
+            dealer_total, dealer_soft = add_card_value(dealer_total, dealer_soft, card)
+        self._invalidate_hand_strs()
+
+        # Compare final hands (player's hand is unchanged since the last hit)
+        player_total, _ = self._player_score
         result, message = compare_hands(player_total, dealer_total)
 
         # Update balance based on result
@@ -221,18 +246,17 @@ class BlackjackGame:
             self.balance -= self.current_bet
         # "push" and "bust" don't change balance (already handled in hit())
 
-        self.game_state = "result"
+        self.game_state = RESULT
         self.result_message = message
 
         # Check for overall game win/loss conditions
         if self.balance >= self.target_balance:
             # Player reached goal!
-            self.game_state = "won"
+            self.game_state = WON
         elif self.balance <= 0:
             # Player out of money
-            self.game_state = "out_of_money"
-            if self.game_state == "out_of_money":
-                self.result_message += " You are out of money!"
+            self.game_state = OUT_OF_MONEY
+            self.result_message += " You are out of money!"
 
         return "stand", message
 
@@ -245,18 +269,20 @@ class BlackjackGame:
         Returns:
             Formatted string with all cards and total value
         """
-        cards_str = ", ".join(str(card) for card in self.player_hand)
-        total, has_ace = calculate_hand_value(self.player_hand)
-        soft_str = " (soft)" if has_ace else ""
-        return f"Player: {cards_str} = {total}{soft_str}"
+        if self._player_str_cache is None:
+            cards_str = ", ".join(str(card) for card in self.player_hand)
+            total, has_ace = self._player_score
+            soft_str = " (soft)" if has_ace else ""
+            self._player_str_cache = f"Player: {cards_str} = {total}{soft_str}"
+        return self._player_str_cache
 
     def get_dealer_hand_str(self, hide_hole_card: bool = False) -> str:
         """Return dealer's hand as a formatted string for display.
         
         Args:
             hide_hole_card: If True, hide the dealer's second card during play
-                - During player's turn ("playing" state): Show only first card
-                - After stand/end ("result" state): Show all cards
+                - During player's turn (PLAYING state): Show only first card
+                - After stand/end (RESULT state): Show all cards
         
         Returns:
             Formatted string with cards and total (or [hidden] for hole card)
@@ -265,16 +291,21 @@ class BlackjackGame:
             - Playing state: "Dealer: K♠, [hidden]"
             - Result state: "Dealer: K♠, 7♥ = 17"
         """
+        cached = self._dealer_str_cache[hide_hole_card]
+        if cached is not None:
+            return cached
         if hide_hole_card and len(self.dealer_hand) >= 2:
             # Only show first card (hole card is hidden)
             cards_str = f"{self.dealer_hand[0]}, [hidden]"
-            return f"Dealer: {cards_str}"
+            text = f"Dealer: {cards_str}"
         else:
             # Show all cards with total
             cards_str = ", ".join(str(card) for card in self.dealer_hand)
             total, has_ace = calculate_hand_value(self.dealer_hand)
             soft_str = " (soft)" if has_ace else ""
-            return f"Dealer: {cards_str} = {total}{soft_str}"
+            text = f"Dealer: {cards_str} = {total}{soft_str}"
+        self._dealer_str_cache[hide_hole_card] = text
+        return text
 
     def reset_balance_on_broke(self):
         """Reset player balance and hands when broke (balance <= 0).
@@ -286,7 +317,7 @@ class BlackjackGame:
         2. Reset current bet to 0
         3. Clear any result message
         4. Reset balance to starting amount
-        5. Move back to "betting" state
+        5. Move back to BETTING state
         6. Optionally reshuffle if deck is low
         
         This allows player to play again without restarting the game.
@@ -297,14 +328,16 @@ class BlackjackGame:
         # Reset hands and prepare for new betting phase
         self.player_hand.clear()
         self.dealer_hand.clear()
+        self._player_score = (0, False)
+        self._invalidate_hand_strs()
         self.current_bet = 0
         self.result_message = ""
         
         # Reset balance to starting amount
         self.balance = self.starting_balance
-        self.game_state = "betting"
+        self.game_state = BETTING
         
         # Reshuffle if deck is getting low
         if self.deck.remaining() < 10:
-            self.deck = Deck()
+            self.deck.reset_and_shuffle()
 
@@ -1,33 +1,75 @@
 """Hand value calculation and outcome comparison for Blackjack."""
 
-from typing import Tuple, List
-from cards import Card, Rank
+from functools import lru_cache
+from typing import Iterable, Tuple
+from cards import Card
 
 
-def calculate_hand_value(cards: List[Card]) -> Tuple[int, bool]:
+def calculate_hand_value(cards: Iterable[Card]) -> Tuple[int, bool]:
     """Calculate hand value with intelligent Ace handling.
     
     Strategy: Count all Aces as 11, convert to 1 until total ≤ 21.
     
     Args:
-        cards: List of Card objects
+        cards: Iterable of Card objects (list, deque, ...)
     
     Returns:
         Tuple of (total_value, hand_has_usable_ace)
     """
-    total = sum(card.get_value(allow_ace_as_one=False) for card in cards)
-    num_aces = sum(1 for card in cards if card.rank == Rank.ACE)
+    total = 0
+    num_aces = 0
+    for card in cards:
+        total += card.value
+        num_aces += card.is_ace
+    return _resolve_aces(total, num_aces)
 
-    # Convert Aces from 11 to 1 until hand <= 21
-    while total > 21 and num_aces > 0:
-        total -= 10
-        num_aces -= 1
+
+def add_card_value(total: int, is_soft: bool, card: Card) -> Tuple[int, bool]:
+    """Add one card to an already-scored hand without rescoring it.
+
+    Args:
+        total: Current hand value (as returned by calculate_hand_value)
+        is_soft: Whether the current hand has an Ace counted as 11
+        card: Card being added
+
+    Returns:
+        Tuple of (total_value, hand_has_usable_ace) for the new hand
+    """
+    # A soft hand holds exactly one Ace still counted as 11
+    return _resolve_aces(total + card.value, is_soft + card.is_ace)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_aces(total: int, num_aces: int) -> Tuple[int, bool]:
+    """Downgrade Aces for a raw total (all Aces as 11); memoized.
+
+    Hands with the same raw total and Ace count always score the same,
+    so only a few hundred distinct keys ever occur.
+    """
+    # Convert just enough Aces from 11 to 1 to bring the hand to <= 21
+    overshoot = total - 21
+    if overshoot > 0:
+        convert = min(num_aces, (overshoot + 9) // 10)
+        total -= 10 * convert
+        num_aces -= convert
 
     # Soft hand if an Ace remains as 11
     has_ace = num_aces > 0
     return total, has_ace
 
 
+# Outcomes keyed on (player busts, dealer busts, sign of player - dealer).
+# A player bust loses regardless of the dealer, then a dealer bust wins.
+_OUTCOMES = {
+    **{(True, dealer_bust, sign): ("bust", "Bust! Dealer wins.")
+       for dealer_bust in (False, True) for sign in (-1, 0, 1)},
+    **{(False, True, sign): ("win", "Dealer busts! You win.") for sign in (-1, 0, 1)},
+    (False, False, 0): ("push", "Push! It's a tie."),
+    (False, False, 1): ("win", "You win!"),
+    (False, False, -1): ("lose", "Dealer wins."),
+}
+
+
 def compare_hands(player_total: int, dealer_total: int) -> Tuple[str, str]:
     """Compare player and dealer hands to determine outcome.
     
@@ -36,13 +78,5 @@ def compare_hands(player_total: int, dealer_total: int) -> Tuple[str, str]:
         - result_string: "bust", "win", "lose", or "push"
         - message_string: Human-readable outcome
     """
-    if player_total > 21:
-        return "bust", "Bust! Dealer wins."
-    elif dealer_total > 21:
-        return "win", "Dealer busts! You win."
-    elif player_total == dealer_total:
-        return "push", "Push! It's a tie."
-    elif player_total > dealer_total:
-        return "win", "You win!"
-    else:
-        return "lose", "Dealer wins."
+    sign = (player_total > dealer_total) - (player_total < dealer_total)
+    return _OUTCOMES[(player_total > 21, dealer_total > 21, sign)]
@@ -17,11 +17,11 @@ Event Flow:
 1. User presses key/clicks mouse → handle_events()
 2. Events route to appropriate handler (dialog, mode screen, or game input)
 3. Game state updates in update()
-4. Screen redraws in render()
-5. Loop repeats at 60 FPS
+4. Screen redraws in render() (only when something changed)
+5. Loop repeats at 60 FPS (events pumped every frame)
 
 Potential Break Points:
-- game_state strings must match game.py (betting/playing/result/etc)
+- game_state constants come from game.py (BETTING/PLAYING/RESULT/etc)
 - pygame initialization must happen before creating window
 - Event handling order matters (dialogs checked first)
 - ESC key returns to mode selection (clears all state)
@@ -35,9 +35,95 @@ import os
 import cards
 import pygame
 import sys
-from game import BlackjackGame
+from collections import OrderedDict, deque
+from game import BlackjackGame, BETTING, PLAYING, RESULT, OUT_OF_MONEY
 
 
+# Rendered text surfaces keyed by (font, text, color). Font rasterization is
+# the most expensive per-frame work, and most strings only change on events.
+# LRU-bounded since balance/bet/hand strings keep producing new keys.
+_TEXT_CACHE_SIZE = 128
+_text_cache = OrderedDict()
+
+
+def render_text(font, text: str, color):
+    """Return an antialiased text surface, rendering only on a cache miss.
+
+    Args:
+        font: Font object for text rendering
+        text: String to render
+        color: RGB tuple for text color
+    """
+    # The font object itself (not id(font)) is part of the key so a
+    # garbage-collected font's id can never alias a new one
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+        if len(_text_cache) > _TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surf
+
+
+def blit_many(surface, blit_list):
+    """Blit a list of (source, position) pairs in a single call.
+
+    Uses Surface.fblits where available (pygame-ce), otherwise
+    Surface.blits without building the list of result rects.
+    """
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits(blit_list)
+    else:
+        surface.blits(blit_list, doreturn=False)
+
+
+# Font objects keyed by (path, size). Each Font() parses the TTF file, and
+# the window, dialog and mode screen ask for the same sizes, so they share
+# one instance per size (and with it the glyph cache).
+_font_cache = {}
+
+
+def get_font(size: int, path=None):
+    """Return the shared Font for (path, size), loading it on first use.
+
+    Args:
+        size: Font size in pixels
+        path: TTF file path, or None for pygame's default font
+    """
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _font_cache[key] = font
+    return font
+
+
+# Keycodes that type a bet digit. A dict rather than a range check because
+# the numpad keycodes are not in digit order (KP0 comes after KP9).
+DIGIT_KEYS = {
+    **{getattr(pygame, f"K_{d}"): str(d) for d in range(10)},
+    **{getattr(pygame, f"K_KP{d}"): str(d) for d in range(10)},
+}
+
+# Window events after which the whole screen must be re-presented (the
+# window's contents were lost or resized), not just the changed regions
+_REPAINT_EVENTS = frozenset((
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED,
+))
+
+# Card back image (in the same asset folder as the card faces)
+CARD_BACK_FILE = 'gray_back.png'
+
+# On-screen card size, and the pre-scaled sprite atlas built from the card
+# PNGs by build_atlas.py (cell index == Card.image_id; back follows the faces)
+CARD_SIZE = (72, 96)
+CARD_ATLAS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cards_atlas.png')
+CARD_ATLAS_COLUMNS = 13
+
 
 class DialogButton:
     """Simple button for dialogs and menus.
@@ -67,25 +153,43 @@ class DialogButton:
         BREAK POINT: callback must be a function, not None
         """
         self.rect = pygame.Rect(x, y, width, height)
+        # Bounds for the per-frame hover test (button never moves)
+        self._x0, self._y0 = x, y
+        self._x1, self._y1 = x + width, y + height
         self.text = text
         self.callback = callback
         self.hovered = False
+        # (style, pre-rendered surfaces), built on first render()
+        self._surfaces = None
 
     def handle_event(self, event):
-        """Handle mouse motion and click events.
+        """Handle click events.
         
-        Updates hover state on mouse motion.
         Calls callback on mouse button down if button is hovered.
+        Hover itself is set once per frame via update_hover().
         
         Args:
             event: Pygame event object
         """
-        if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
+        if event.type == pygame.MOUSEBUTTONDOWN:
             if self.hovered:
                 self.callback()
 
+    def update_hover(self, pos) -> bool:
+        """Set hover state from a mouse position.
+
+        BlackjackWindow calls this once per frame with the last mouse
+        position instead of forwarding every MOUSEMOTION event.
+
+        Returns:
+            True if the hover state changed (button needs redrawing)
+        """
+        px, py = pos
+        hovered = self._x0 <= px < self._x1 and self._y0 <= py < self._y1
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
+
     def on_click(self):
         """Trigger the button's callback (programmatic click).
         
@@ -107,17 +211,38 @@ class DialogButton:
         1. Rectangle background (color changes on hover)
         2. Border outline
         3. Centered text
+
+        The pieces are built once per font/color combination (see
+        _build_surfaces), so each call is two blits.
         """
-        # Choose color based on hover state
-        color = color_hover if self.hovered else color_button
-        # Draw filled rectangle for button background
-        pygame.draw.rect(screen, color, self.rect)
-        # Draw border around button (2 pixel width)
-        pygame.draw.rect(screen, color_text, self.rect, 2)
+        style = (font, color_button, color_hover, color_text)
+        if self._surfaces is None or self._surfaces[0] != style:
+            self._surfaces = (style, self._build_surfaces(font, color_button, color_hover, color_text))
+        surf_normal, surf_hover, text_surf, text_rect = self._surfaces[1]
+        screen.blit(surf_hover if self.hovered else surf_normal, self.rect.topleft)
+        screen.blit(text_surf, text_rect)
+
+    def _build_surfaces(self, font, color_button, color_hover, color_text):
+        """Pre-render the button body (normal and hover) and its label.
+
+        The label is kept separate from the body because it may be wider
+        than the button and must not be clipped to it.
+
+        Returns:
+            Tuple of (normal body, hovered body, text surface, text rect)
+        """
+        bodies = []
+        for color in (color_button, color_hover):
+            body = pygame.Surface(self.rect.size).convert()
+            # Filled rectangle for button background
+            body.fill(color)
+            # Border around button (2 pixel width)
+            pygame.draw.rect(body, color_text, body.get_rect(), 2)
+            bodies.append(body)
         # Render text and center it on button
         text_surf = font.render(self.text, True, color_text)
         text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        return bodies[0], bodies[1], text_surf, text_rect
 
 
 class OutOfMoneyDialog:
@@ -135,8 +260,9 @@ class OutOfMoneyDialog:
         self.game = game
         self.width = width
         self.height = height
-        self.x = (screen.get_width() - width) // 2
-        self.y = (screen.get_height() - height) // 2
+        self._screen_w, self._screen_h = screen.get_size()
+        self.x = (self._screen_w - width) // 2
+        self.y = (self._screen_h - height) // 2
 
         # Colors
         self.color_bg = (40, 40, 40)
@@ -145,9 +271,9 @@ class OutOfMoneyDialog:
         self.color_button_hover = (100, 150, 255)
 
         # Fonts
-        self.font_title = pygame.font.Font(None, 40)
-        self.font_message = pygame.font.Font(None, 28)
-        self.font_button = pygame.font.Font(None, 24)
+        self.font_title = get_font(40)
+        self.font_message = get_font(28)
+        self.font_button = get_font(24)
 
         # Button
         button_width = 200
@@ -157,6 +283,29 @@ class OutOfMoneyDialog:
         self.button = DialogButton(button_x, button_y, button_width, button_height,
                                     "Get More Money", self.on_button_click)
 
+        # Everything but the button is static: build it once, blit per frame
+        # Semi-transparent overlay
+        self._overlay = pygame.Surface((self._screen_w, self._screen_h))
+        self._overlay.set_alpha(200)
+        self._overlay.fill((0, 0, 0))
+        self._static_bg = self._build_static_bg()
+
+    def _build_static_bg(self):
+        """Render dialog background, border, title and message to a surface."""
+        bg = pygame.Surface((self.width, self.height))
+        # Dialog background
+        bg.fill(self.color_bg)
+        pygame.draw.rect(bg, self.color_text, (0, 0, self.width, self.height), 3)
+
+        # Title
+        title_text = self.font_title.render("You Ran Out of Money!", True, (255, 100, 100))
+        bg.blit(title_text, title_text.get_rect(center=(self.width // 2, 40)))
+
+        # Message
+        msg_text = self.font_message.render("Click the button below for more chips.", True, self.color_text)
+        bg.blit(msg_text, msg_text.get_rect(center=(self.width // 2, 100)))
+        return bg
+
     def on_button_click(self):
         """Handle button click."""
         self.game.reset_balance_on_broke()
@@ -167,27 +316,8 @@ class OutOfMoneyDialog:
 
     def render(self):
         """Render dialog."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        # Dialog background
-        pygame.draw.rect(self.screen, self.color_bg,
-                         (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(self.screen, self.color_text,
-                         (self.x, self.y, self.width, self.height), 3)
-
-        # Title
-        title_text = self.font_title.render("You Ran Out of Money!", True, (255, 100, 100))
-        title_rect = title_text.get_rect(center=(self.x + self.width // 2, self.y + 40))
-        self.screen.blit(title_text, title_rect)
-
-        # Message
-        msg_text = self.font_message.render("Click the button below for more chips.", True, self.color_text)
-        msg_rect = msg_text.get_rect(center=(self.x + self.width // 2, self.y + 100))
-        self.screen.blit(msg_text, msg_rect)
+        self.screen.blit(self._overlay, (0, 0))
+        self.screen.blit(self._static_bg, (self.x, self.y))
 
         # Button
         self.button.render(self.screen, self.font_button, self.color_button,
@@ -213,8 +343,8 @@ class GameModeScreen:
         self.color_button_hover = (100, 100, 200)
 
         # Fonts
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
 
         # Buttons
         button_width = 250
@@ -230,6 +360,31 @@ class GameModeScreen:
 
         self.buttons = [self.btn_classic]
 
+        # Screen is static apart from button hover: pre-render one full
+        # frame per hover combination (keyed by each button's hovered flag)
+        self._frames = {}
+
+    def _build_frame(self):
+        """Render background, titles and buttons (current hover) to a surface."""
+        base = pygame.Surface((self.screen.get_width(), self.screen.get_height())).convert()
+        base.fill(self.color_bg)
+
+        # Title
+        title_text = self.font_large.render("Blackjack", True, self.color_text)
+        title_rect = title_text.get_rect(center=(base.get_width() // 2, 50))
+        base.blit(title_text, title_rect)
+
+        # Subtitle
+        subtitle_text = self.font_medium.render("Select Game Mode", True, self.color_text)
+        subtitle_rect = subtitle_text.get_rect(center=(base.get_width() // 2, 100))
+        base.blit(subtitle_text, subtitle_rect)
+
+        # Render buttons
+        for btn in self.buttons:
+            btn.render(base, self.font_medium, self.color_button,
+                       self.color_button_hover, self.color_text)
+        return base
+
     def _select(self, mode: str):
         """Set selected mode."""
         self.selected_mode = mode
@@ -249,22 +404,11 @@ class GameModeScreen:
 
     def render(self):
         """Render game mode selection screen."""
-        self.screen.fill(self.color_bg)
-
-        # Title
-        title_text = self.font_large.render("Blackjack", True, self.color_text)
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 50))
-        self.screen.blit(title_text, title_rect)
-
-        # Subtitle
-        subtitle_text = self.font_medium.render("Select Game Mode", True, self.color_text)
-        subtitle_rect = subtitle_text.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(subtitle_text, subtitle_rect)
-
-        # Render buttons
-        for btn in self.buttons:
-            btn.render(self.screen, self.font_medium, self.color_button,
-                      self.color_button_hover, self.color_text)
+        key = tuple(btn.hovered for btn in self.buttons)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = self._build_frame()
+        self.screen.blit(frame, (0, 0))
 
         pygame.display.flip()
 
@@ -288,16 +432,25 @@ class BlackjackWindow:
         self.width = width
         self.height = height
         self.title = title
-        self.screen = pygame.display.set_mode((width, height))
+        self.screen = self._create_display(width, height)
         pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
         self.running = True
         self.fps = 60
+        # Console messages waiting to be written (see _log)
+        self._log_queue = deque()
+        # Set when input/state/hover changes; run() only redraws when set
+        self._dirty = True
+        # What the last game frame put on screen (see _present); a full
+        # flip is forced after the mode screen or a dialog opening/closing
+        self._full_flip = True
+        self._shown_items = set()
+        self._shown_dialog = None
 
         # Fonts for text rendering
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(24)
 
         # Colors
         self.color_bg = (0, 100, 0)  # Green felt
@@ -306,6 +459,11 @@ class BlackjackWindow:
         self.color_button_hover = (100, 100, 200)
         self.color_text_dark = (0, 0, 0)
 
+        # Controls line never changes; render it once
+        self._controls_surf = self.font_small.render(
+            "H: Hit | S: Stand | N: New Hand | ESC: Cancel", True, self.color_text
+        )
+
         # Game instance
         self.game = BlackjackGame(starting_balance=starting_balance, target_balance=target_balance, mode=mode)
 
@@ -320,36 +478,166 @@ class BlackjackWindow:
         self.screen_state = "mode_select"
         self.game_mode_screen = GameModeScreen(self.screen)
 
-        # Card images: load PNGs for card faces and a back image
-        self.card_size = (72, 96)
-        self.card_images = {}
+        # Card images: loaded on first use (_get_card_image), from the
+        # sprite atlas if present, otherwise one PNG per card.
+        # Faces are stored by Card.image_id (0-51): None means not loaded
+        # yet, False means the image is missing (fall back to text).
+        self.card_size = CARD_SIZE
+        self._assets_path = os.path.join(os.path.dirname(__file__), 'pygame_cards-0.1', 'cards', 'PNG')
+        self.card_images_by_id = [None] * len(cards.ALL_CARDS)
         self.card_back_image = None
+        self._atlas_tried = False
         # Layout controls for cards
         self.card_spacing = 14
         self.card_left_margin = 140  # leave space for left-side text
         self.card_right_margin = 20
+        # Distance between the left edges of adjacent cards in a row
+        self._card_stride = self.card_size[0] + self.card_spacing
+        # Pre-composed card rows: (hand key, surface, x), rebuilt when a hand changes
+        self._dealer_row_cache = (None, None, None)
+        self._player_row_cache = (None, None, None)
+
+    def _log(self, msg: str):
+        """Queue a console message; run() writes queued messages each frame.
+
+        Console writes can block for milliseconds (notably on Windows when
+        the console scrolls), so they are kept out of event handling.
+        """
+        self._log_queue.append(msg)
+
+    def _flush_log(self, flush: bool = False):
+        """Write queued console messages; optionally flush stdout."""
+        queue = self._log_queue
+        while queue:
+            sys.stdout.write(queue.popleft() + "\n")
+        if flush:
+            sys.stdout.flush()
+
+    @staticmethod
+    def _create_display(width: int, height: int):
+        """Create the display, preferring a vsync'd renderer.
+
+        Set BLACKJACK_NO_VSYNC=1 to use a plain display without vsync.
+
+        set_mode() can silently fall back to a renderer that doesn't wait
+        for vblank, so callers must not rely on vsync for frame pacing.
+        """
+        if not os.environ.get("BLACKJACK_NO_VSYNC"):
+            try:
+                return pygame.display.set_mode(
+                    (width, height), pygame.SCALED | pygame.DOUBLEBUF, vsync=1
+                )
+            except (pygame.error, TypeError):
+                # No vsync support (driver or older pygame): fall back below
+                pass
+        return pygame.display.set_mode((width, height))
+
+    def _prepare_card_image(self, img):
+        """Convert a scaled card image to its blit-ready form.
+
+        Cards are opaque apart from fully transparent rounded corners, so
+        the image is flattened onto the felt color and stored without
+        per-pixel alpha (display format via convert()). The corners are
+        keyed out with an RLE colorkey, which lets blits skip them and use
+        SDL's plain copy path instead of alpha blending.
+        """
+        flat = pygame.Surface(self.card_size).convert()
+        flat.fill(self.color_bg)
+        flat.blit(img, (0, 0))
+        flat.set_colorkey(self.color_bg, pygame.RLEACCEL)
+        return flat
+
+    def _load_card_image(self, fname: str):
+        """Load and scale one card PNG; return False if it can't be loaded."""
         try:
-            assets_path = os.path.join(os.path.dirname(__file__), 'pygame_cards-0.1', 'cards', 'PNG')
-            for fname in os.listdir(assets_path):
-                if not fname.lower().endswith('.png'):
-                    continue
-                key = fname[:-4]  # strip .png
-                img = pygame.image.load(os.path.join(assets_path, fname)).convert_alpha()
-                img = pygame.transform.scale(img, self.card_size)
-                # Store backs as a special key
-                if 'back' in fname.lower():
-                    self.card_back_image = img
-                else:
-                    self.card_images[key] = img
-        except Exception as e:
-            # If loading images fails, keep dict empty and fall back to text rendering
-            print(f"Failed to load card images: {e}")
-        # Track missing keys to avoid spamming logs
-        self._missing_keys_reported = set()
+            img = pygame.image.load(os.path.join(self._assets_path, fname)).convert_alpha()
+            return self._prepare_card_image(pygame.transform.scale(img, self.card_size))
+        except (pygame.error, OSError) as e:
+            # Reported once: the False result is memoized by the callers
+            self._log(f"Failed to load card image {fname}: {e}")
+            return False
+
+    def _load_atlas(self):
+        """Fill all card images from the sprite atlas (one file, one decode).
+
+        Does nothing if the atlas is missing or was built for another card
+        size; images are then loaded per file as they are needed.
+        """
+        self._atlas_tried = True
+        if not os.path.exists(CARD_ATLAS_FILE):
+            return
+        try:
+            atlas = pygame.image.load(CARD_ATLAS_FILE).convert_alpha()
+        except pygame.error as e:
+            self._log(f"Failed to load card atlas: {e}")
+            return
+        card_w, card_h = self.card_size
+        num_cards = len(self.card_images_by_id)
+        if atlas.get_size() != (CARD_ATLAS_COLUMNS * card_w, (num_cards // CARD_ATLAS_COLUMNS + 1) * card_h):
+            self._log("Card atlas size doesn't match card size; rebuild it with build_atlas.py")
+            return
+
+        def cell(idx):
+            col, row = idx % CARD_ATLAS_COLUMNS, idx // CARD_ATLAS_COLUMNS
+            return self._prepare_card_image(atlas.subsurface((col * card_w, row * card_h, card_w, card_h)))
+
+        for idx in range(num_cards):
+            self.card_images_by_id[idx] = cell(idx)
+        self.card_back_image = cell(num_cards)
+
+    def _get_card_image(self, card):
+        """Return a card's face surface (or False if missing), loading it once."""
+        surf = self.card_images_by_id[card.image_id]
+        if surf is None and not self._atlas_tried:
+            self._load_atlas()
+            surf = self.card_images_by_id[card.image_id]
+        if surf is None:
+            surf = self._load_card_image(card.image_key() + '.png')
+            self.card_images_by_id[card.image_id] = surf
+        return surf
+
+    def _get_card_back(self):
+        """Return the card back surface (or False if missing), loading it once."""
+        if self.card_back_image is None and not self._atlas_tried:
+            self._load_atlas()
+        if self.card_back_image is None:
+            self.card_back_image = self._load_card_image(CARD_BACK_FILE)
+        return self.card_back_image
+
+    def _active_buttons(self):
+        """Return the buttons currently on screen (for hover updates)."""
+        if self.screen_state == "mode_select":
+            return self.game_mode_screen.buttons
+        if self.out_of_money_dialog is not None:
+            return [self.out_of_money_dialog.button]
+        return []
 
     def handle_events(self):
-        """Handle pygame events (quit, keyboard input, etc.)."""
+        """Handle pygame events (quit, keyboard input, etc.).
+
+        Mouse motion is coalesced: only the last position of the frame is
+        used, and each visible button's hover is tested once against it
+        before the remaining events are handled (so a click in the same
+        frame sees the up-to-date hover state).
+        """
+        motion_pos = None
+        events = []
         for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                motion_pos = event.pos
+            else:
+                events.append(event)
+
+        if motion_pos is not None:
+            for btn in self._active_buttons():
+                if btn.update_hover(motion_pos):
+                    self._dirty = True
+
+        for event in events:
+            # Any key/click/window event may change what is shown
+            self._dirty = True
+            if event.type in _REPAINT_EVENTS:
+                self._full_flip = True
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -376,21 +664,21 @@ class BlackjackWindow:
                 # Game controls
                 if event.key == pygame.K_h:
                     # Hit
-                    if self.game.game_state == "playing":
+                    if self.game.game_state == PLAYING:
                         action, msg = self.game.player_hit()
-                        print(f"[HIT] {msg}")
+                        self._log(f"[HIT] {msg}")
 
                 elif event.key == pygame.K_s:
                     # Stand
-                    if self.game.game_state == "playing":
+                    if self.game.game_state == PLAYING:
                         action, msg = self.game.player_stand()
-                        print(f"[STAND] {msg}")
+                        self._log(f"[STAND] {msg}")
 
                 elif event.key == pygame.K_n:
                     # New hand
-                    if self.game.game_state == "result" or self.game.game_state == "betting":
+                    if self.game.game_state == RESULT or self.game.game_state == BETTING:
                         self.game.reset_for_new_hand()
-                        print("[NEW HAND] Ready for new game.")
+                        self._log("[NEW HAND] Ready for new game.")
 
                 elif event.key == pygame.K_RETURN:
                     # Confirm bet (if currently inputting)
@@ -402,8 +690,13 @@ class BlackjackWindow:
                     if self.input_active:
                         self.current_input = self.current_input[:-1]
 
+                elif event.key in DIGIT_KEYS:
+                    # Add digit to bet input (top row or numpad)
+                    if self.input_active and len(self.current_input) < 5:
+                        self.current_input += DIGIT_KEYS[event.key]
+
                 elif event.unicode.isdigit():
-                    # Add digit to bet input
+                    # Layouts whose digit keys have other keycodes (e.g. AZERTY)
                     if self.input_active and len(self.current_input) < 5:
                         self.current_input += event.unicode
 
@@ -414,20 +707,20 @@ class BlackjackWindow:
                     self.current_input = ""
                     self.out_of_money_dialog = None
                     self.game_mode_screen = GameModeScreen(self.screen)
-                    print("[ESC] Returning to mode selection...")
+                    self._log("[ESC] Returning to mode selection...")
 
     def _process_bet_input(self):
         """Process the current bet input."""
         # Normal betting flow (classic mode only)
 
         if not self.current_input:
-            print("[BET] No amount entered.")
+            self._log("[BET] No amount entered.")
             return
 
         try:
             bet_amount = int(self.current_input)
             success, msg = self.game.place_bet(bet_amount)
-            print(f"[BET] {msg}")
+            self._log(f"[BET] {msg}")
 
             if success:
                 self.game.deal_initial_hands()
@@ -437,7 +730,7 @@ class BlackjackWindow:
                 self.current_input = ""
 
         except ValueError:
-            print("[BET] Invalid input.")
+            self._log("[BET] Invalid input.")
             self.current_input = ""
 
     def update(self):
@@ -447,140 +740,189 @@ class BlackjackWindow:
             return
         
         # Check if out-of-money dialog should be shown
-        if self.game.game_state == "out_of_money" and self.out_of_money_dialog is None:
+        if self.game.game_state == OUT_OF_MONEY and self.out_of_money_dialog is None:
             self.out_of_money_dialog = OutOfMoneyDialog(self.screen, self.game)
+            self._dirty = True
 
         # Close dialog if game state changed
-        if self.out_of_money_dialog is not None and self.game.game_state != "out_of_money":
+        if self.out_of_money_dialog is not None and self.game.game_state != OUT_OF_MONEY:
             self.out_of_money_dialog = None
+            self._dirty = True
 
         # Check if we need to start betting
-        if self.game.game_state == "betting" and not self.input_active:
-            print(f"\n--- New Hand ---")
-            print(f"Balance: {self.game.balance}")
-            print("Enter bet amount (press 'H' for Hit, 'S' for Stand, 'N' for New Hand, ESC to cancel):")
+        if self.game.game_state == BETTING and not self.input_active:
+            self._log(f"\n--- New Hand ---")
+            self._log(f"Balance: {self.game.balance}")
+            self._log("Enter bet amount (press 'H' for Hit, 'S' for Stand, 'N' for New Hand, ESC to cancel):")
             self.input_active = True
+            self._dirty = True
+
+    def _card_row_x(self, num_cards: int) -> int:
+        """Return the left x of a centered row of cards, kept within margins."""
+        total_width = num_cards * self._card_stride - self.card_spacing
+        start_x = (self.width - total_width) // 2
+        # enforce left/right margins so cards don't overlap HUD text
+        if start_x < self.card_left_margin:
+            start_x = self.card_left_margin
+        if start_x + total_width > self.width - self.card_right_margin:
+            start_x = self.width - self.card_right_margin - total_width
+        return start_x
+
+    def _build_card_row(self, hand, hide_hole_card: bool):
+        """Compose a hand's cards onto one surface.
+
+        The row is cached by render() and only rebuilt when the hand (or
+        hole card visibility) changes, so static frames cost one blit.
+        Like the card images, it is an opaque display-format surface with
+        the felt color keyed out, so that blit takes the copy path too.
+        """
+        card_w, card_h = self.card_size
+        num_cards = len(hand)
+        row = pygame.Surface((num_cards * self._card_stride - self.card_spacing, card_h)).convert()
+        row.fill(self.color_bg)
+        # Collect every blit and issue them in one batched call
+        blit_list = []
+        for idx, card in enumerate(hand):
+            x = idx * self._card_stride
+            if hide_hole_card and idx == 1:
+                back = self._get_card_back()
+                if back:
+                    blit_list.append((back, (x, 0)))
+                else:
+                    pygame.draw.rect(row, (200, 200, 200), (x, 0, card_w, card_h))
+                continue
+            surf = self._get_card_image(card)
+            if surf:
+                blit_list.append((surf, (x, 0)))
+            else:
+                # fallback: render card text
+                t = render_text(self.font_small, str(card), self.color_text)
+                blit_list.append((t, (x + 5, card_h // 2 - 8)))
+        blit_many(row, blit_list)
+        row.set_colorkey(self.color_bg, pygame.RLEACCEL)
+        return row
 
     def render(self):
         """Render the game state to the screen."""
         # If on mode select screen, render that instead
         if self.screen_state == "mode_select":
             self.game_mode_screen.render()
+            self._full_flip = True
             return
 
+        # Bind hot attributes once for this frame
+        game = self.game
+        height = self.height
+        font_small = self.font_small
+        color_text = self.color_text
+        playing = game.game_state == PLAYING
+
         self.screen.fill(self.color_bg)
 
+        # Everything below is collected in draw order and blitted in one call
         # Display balance and bet info
-        balance_text = self.font_medium.render(f"Balance: ${self.game.balance}", True, self.color_text)
-        bet_text = self.font_medium.render(f"Bet: ${self.game.current_bet}", True, self.color_text)
-        self.screen.blit(balance_text, (20, 20))
-        self.screen.blit(bet_text, (20, 60))
-
-        # Display hands as images and text
-        player_hand_text = self.font_small.render(self.game.get_player_hand_str(), True, self.color_text)
-        if self.game.game_state == "playing":
-            dealer_hand_text = self.font_small.render(
-                self.game.get_dealer_hand_str(hide_hole_card=True), True, self.color_text
-            )
-        else:
-            dealer_hand_text = self.font_small.render(
-                self.game.get_dealer_hand_str(hide_hole_card=False), True, self.color_text
-            )
-        self.screen.blit(player_hand_text, (20, self.height - 100))
-        self.screen.blit(dealer_hand_text, (20, 100))
-
-        # Draw card images for dealer and player
-        card_w, card_h = self.card_size
+        blit_list = [
+            (render_text(self.font_medium, f"Balance: ${game.balance}", color_text), (20, 20)),
+            (render_text(self.font_medium, f"Bet: ${game.current_bet}", color_text), (20, 60)),
+        ]
+
+        # Display hands as images and text (hole card hidden while playing)
+        blit_list.append((render_text(font_small, game.get_player_hand_str(), color_text), (20, height - 100)))
+        blit_list.append((render_text(font_small, game.get_dealer_hand_str(hide_hole_card=playing), color_text),
+                          (20, 100)))
+
+        # Draw card images for dealer and player; rows are cached as
+        # (hand key, surface, x) and rebuilt only when the hand changes
         # Dealer: top center
-        dealer_cards = self.game.dealer_hand
+        dealer_cards = game.dealer_hand
         if dealer_cards:
-            total_width = len(dealer_cards) * card_w + max(0, (len(dealer_cards) - 1)) * self.card_spacing
-            start_x = (self.width - total_width) // 2
-            # enforce left/right margins so cards don't overlap HUD text
-            if start_x < self.card_left_margin:
-                start_x = self.card_left_margin
-            if start_x + total_width > self.width - self.card_right_margin:
-                start_x = self.width - self.card_right_margin - total_width
-            y = 100
-            for idx, card in enumerate(dealer_cards):
-                x = start_x + idx * (card_w + self.card_spacing)
-                # hide hole card while playing
-                if self.game.game_state == 'playing' and idx == 1:
-                    if self.card_back_image:
-                        self.screen.blit(self.card_back_image, (x, y))
-                    else:
-                        pygame.draw.rect(self.screen, (200, 200, 200), (x, y, card_w, card_h))
-                else:
-                    key = getattr(card, 'image_key', None) and card.image_key()
-                    surf = None
-                    if key is not None:
-                        surf = self.card_images.get(key)
-                    if surf:
-                        self.screen.blit(surf, (x, y))
-                    else:
-                        # Debug: report missing image once
-                        if key is not None and key not in self._missing_keys_reported:
-                            print(f"Missing card image for {key}")
-                            self._missing_keys_reported.add(key)
-                        # fallback: render card text
-                        t = self.font_small.render(str(card), True, self.color_text)
-                        self.screen.blit(t, (x + 5, y + card_h//2 - 8))
+            key = (tuple(card.image_id for card in dealer_cards), playing)
+            if key != self._dealer_row_cache[0]:
+                self._dealer_row_cache = (key, self._build_card_row(dealer_cards, playing),
+                                          self._card_row_x(len(dealer_cards)))
+            _, row, x = self._dealer_row_cache
+            blit_list.append((row, (x, 100)))
 
         # Player: bottom center
-        player_cards = self.game.player_hand
+        player_cards = game.player_hand
         if player_cards:
-            total_width = len(player_cards) * card_w + max(0, (len(player_cards) - 1)) * self.card_spacing
-            start_x = (self.width - total_width) // 2
-            if start_x < self.card_left_margin:
-                start_x = self.card_left_margin
-            if start_x + total_width > self.width - self.card_right_margin:
-                start_x = self.width - self.card_right_margin - total_width
-            y = self.height - card_h - 40
-            for idx, card in enumerate(player_cards):
-                x = start_x + idx * (card_w + self.card_spacing)
-                key = getattr(card, 'image_key', None) and card.image_key()
-                surf = None
-                if key is not None:
-                    surf = self.card_images.get(key)
-                if surf:
-                    self.screen.blit(surf, (x, y))
-                else:
-                    t = self.font_small.render(str(card), True, self.color_text)
-                    self.screen.blit(t, (x + 5, y + card_h//2 - 8))
+            key = tuple(card.image_id for card in player_cards)
+            if key != self._player_row_cache[0]:
+                self._player_row_cache = (key, self._build_card_row(player_cards, False),
+                                          self._card_row_x(len(player_cards)))
+            _, row, x = self._player_row_cache
+            blit_list.append((row, (x, height - self.card_size[1] - 40)))
 
         # Display game state message
-        if self.game.result_message:
-            msg_text = self.font_medium.render(self.game.result_message, True, (255, 215, 0))
-            self.screen.blit(msg_text, (20, self.height // 2 - 30))
+        if game.result_message:
+            msg_text = render_text(self.font_medium, game.result_message, (255, 215, 0))
+            blit_list.append((msg_text, (20, height // 2 - 30)))
 
         # Display input prompt
         if self.input_active:
-            prompt_text = self.font_small.render(f"Bet: ${self.current_input}_", True, self.color_text)
-            self.screen.blit(prompt_text, (20, self.height // 2 + 50))
+            prompt_text = render_text(font_small, f"Bet: ${self.current_input}_", color_text)
+            blit_list.append((prompt_text, (20, height // 2 + 50)))
 
         # Display controls
-        controls_y = self.height - 40
-        controls_text = self.font_small.render("H: Hit | S: Stand | N: New Hand | ESC: Cancel", True, self.color_text)
-        self.screen.blit(controls_text, (20, controls_y))
+        controls_y = height - 40
+        blit_list.append((self._controls_surf, (20, controls_y)))
+
+        blit_many(self.screen, blit_list)
 
         # Display out-of-money dialog if active
         if self.out_of_money_dialog is not None:
             self.out_of_money_dialog.render()
 
-        pygame.display.flip()
+        self._present(blit_list)
+
+    def _present(self, blit_list):
+        """Push the finished frame to the display.
+
+        Cached surfaces are reused while their content is unchanged, so any
+        (surface, pos) item not shown last frame (or shown but now gone)
+        marks a changed region; only those rects are updated.
+        """
+        dialog = self.out_of_money_dialog
+        shown_dialog = None if dialog is None else (dialog, dialog.button.hovered)
+        items = set(blit_list)
+
+        if self._full_flip or (shown_dialog is None) != (self._shown_dialog is None):
+            pygame.display.flip()
+        else:
+            dirty_rects = [surf.get_rect(topleft=pos) for surf, pos in items ^ self._shown_items]
+            if shown_dialog != self._shown_dialog:
+                # Button hover changed: the dialog box covers the button
+                dirty_rects.append(pygame.Rect(dialog.x, dialog.y, dialog.width, dialog.height))
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+
+        self._full_flip = False
+        self._shown_items = items
+        self._shown_dialog = shown_dialog
 
     def run(self):
         """Main game loop."""
-        print("=== Blackjack ===")
-        print("Controls: H (Hit), S (Stand), N (New Hand), ESC (Cancel)")
-        print()
+        self._log("=== Blackjack ===")
+        self._log("Controls: H (Hit), S (Stand), N (New Hand), ESC (Cancel)")
+        self._log("")
 
+        frame = 0
         while self.running:
             self.handle_events()
             self.update()
-            self.render()
+            # Only redraw when something visible changed; events are still
+            # pumped every frame period
+            if self._dirty:
+                self.render()
+                self._dirty = False
+            # Console output is written after the frame, off the input path
+            self._flush_log(flush=frame % 30 == 0)
+            frame += 1
+            # Always cap: after a flip that did wait for vblank this sleeps
+            # ~0 ms anyway
             self.clock.tick(self.fps)
 
+        self._flush_log(flush=True)
         pygame.quit()
         sys.exit()
 